@@ -0,0 +1,80 @@
+// app/api/analyze/batch/route.ts
+// Batch audits: fan several URLs out to Backend-B concurrently instead of one HTTP round-trip each.
+// Concurrency is bounded by CPU count so Backend-B's Chromium workers stay busy without oversubscribing.
+
+export const runtime = "nodejs";
+export const dynamic = "force-dynamic";
+export const revalidate = 0;
+
+import os from "node:os";
+import { NextRequest, NextResponse } from "next/server";
+import { z } from "zod";
+import type { AccessibilityResults } from "@/lib/types";
+import {
+  createAudit,
+  waitForAuditResult,
+  mapBResultToAccessibilityResults,
+} from "@/lib/backendB";
+
+/** Max URLs accepted per batch, and max audits in flight at once */
+const MAX_URLS = 50;
+const CONCURRENCY = os.cpus().length || 4;
+
+/** Validate incoming body: { urls: string[] } */
+const batchSchema = z.object({
+  urls: z
+    .array(z.string().url("Please provide valid URLs"))
+    .min(1, "Please provide at least one URL")
+    .max(MAX_URLS, `At most ${MAX_URLS} URLs per batch`),
+});
+
+/** Per-URL outcome; one failed audit does not fail the whole batch */
+type BatchItem = { url: string; result: AccessibilityResults } | { url: string; error: string };
+
+/** Run fn over items with at most `limit` calls in flight; output keeps input order */
+async function mapBounded<T, R>(
+  items: T[],
+  limit: number,
+  fn: (item: T) => Promise<R>
+): Promise<R[]> {
+  const out = new Array<R>(items.length);
+  let next = 0;
+  async function worker() {
+    while (next < items.length) {
+      const i = next++;
+      out[i] = await fn(items[i]);
+    }
+  }
+  await Promise.all(Array.from({ length: Math.min(limit, items.length) }, worker));
+  return out;
+}
+
+/** Audit one URL on Backend-B, capturing failures as an error entry */
+async function auditOne(url: string): Promise<BatchItem> {
+  try {
+    const { id } = await createAudit(url);
+    const raw = await waitForAuditResult(id);
+    return { url, result: mapBResultToAccessibilityResults(raw) };
+  } catch (e: any) {
+    console.warn("[analyze/batch] Backend-B error:", url, e?.message);
+    return { url, error: String(e?.message ?? "analyze failed") };
+  }
+}
+
+export async function POST(req: NextRequest) {
+  const body = await req.json().catch(() => ({}));
+  const parsed = batchSchema.safeParse(body);
+  if (!parsed.success) {
+    const msg = parsed.error.issues[0]?.message ?? "Invalid request body";
+    return NextResponse.json({ error: msg }, { status: 400 });
+  }
+  if (!process.env.BACKEND_B_URL) {
+    return NextResponse.json(
+      { error: "backend_b_failed", detail: "BACKEND_B_URL not set" },
+      { status: 502 }
+    );
+  }
+
+  const results = await mapBounded(parsed.data.urls, CONCURRENCY, auditOne);
+  return NextResponse.json({ results }, { status: 200 });
+}
@@ -13,7 +13,20 @@ import type {
   AccessibilityViolation,
   AccessibilityPass,
 } from "@/lib/types";
-import { createAudit, waitForAuditResult } from "@/lib/backendB";
+import {
+  createAudit,
+  waitForAuditResult,
+  gradeFromScore,
+  mapBResultToAccessibilityResults,
+} from "@/lib/backendB";
+
+/** Backend-B settings, resolved once at module load instead of per request */
+const B_URL = process.env.BACKEND_B_URL;
+const FORCE_B = process.env.FORCE_BACKEND_B === "1";
+const TIMEOUT_MS = Number(process.env.ANALYZE_TIMEOUT_MS || 30000);
+const POLL_MS = Number(process.env.ANALYZE_POLL_MS || 1200);
+const CACHE_TTL_MS = Number(process.env.ANALYZE_CACHE_TTL_MS || 60000);
+const CACHE_MAX_ENTRIES = 256;
 
 /** Validate incoming body: { url: string } */
 const analyzeSchema = z.object({
@@ -187,21 +200,23 @@ function buildSummary(
   };
 }
 
+/** Score penalty per violation of each impact level */
+const IMPACT_WEIGHTS: Record<Impact, number> = {
+  critical: 30,
+  serious: 20,
+  moderate: 10,
+  minor: 5,
+};
+
 /** Simple scoring heuristic used by the mock */
 function scoreFromCounts(c: Record<Impact, number>) {
-  const penalty = c.critical * 30 + c.serious * 20 + c.moderate * 10 + c.minor * 5;
+  let penalty = 0;
+  for (const impact of Object.keys(IMPACT_WEIGHTS) as Impact[]) {
+    penalty += c[impact] * IMPACT_WEIGHTS[impact];
+  }
   return Math.max(0, 100 - penalty);
 }
 
-/** Convert numeric score to letter grade */
-function gradeFromScore(score: number): AccessibilityResults["grade"] {
-  if (score >= 90) return "A";
-  if (score >= 80) return "B";
-  if (score >= 70) return "C";
-  if (score >= 60) return "D";
-  return "F";
-}
-
 /** Local mock analyzer (used if Backend-B is unavailable) */
 async function analyzeAccessibilityMock(url: string): Promise<AccessibilityResults> {
   await new Promise((r) => setTimeout(r, 1200)); // simulate analyzer latency
@@ -291,67 +306,39 @@ async function analyzeAccessibilityMock(url: string): Promise<AccessibilityResul
   };
 }
 
-/** Types describing Backend-B violation payloads */
-type BAuditViolation = {
-  source: "axe" | "lighthouse";
-  rule_id: string;
-  severity: Impact;
-  description?: string;
-  help?: string;
-  helpUrl?: string;
-  wcag_refs?: string[];
-  nodes?: { target: string[]; html?: string; failureSummary?: string }[];
-};
-
-/** Map Backend-B severity (same literals) to our impact union */
-function mapSeverityToImpact(s: BAuditViolation["severity"]): Impact {
-  return s;
+/**
+ * Recent Backend-B results by URL, kept as serialized JSON so cache hits are
+ * served without re-stringifying. Map insertion order doubles as LRU order.
+ */
+const resultCache = new Map<string, { at: number; body: string }>();
+
+/** Return a cached body if it is younger than CACHE_TTL_MS, refreshing its LRU slot */
+function getCachedResult(url: string): string | undefined {
+  const hit = resultCache.get(url);
+  if (!hit) return undefined;
+  resultCache.delete(url);
+  if (Date.now() - hit.at > CACHE_TTL_MS) return undefined;
+  resultCache.set(url, hit);
+  return hit.body;
 }
 
-/** Convert Backend-B AuditResult into the front-end AccessibilityResults */
-function mapBResultToAccessibilityResults(b: any): AccessibilityResults {
-  const violations: AccessibilityViolation[] = (b.violations ?? []).map(
-    (v: BAuditViolation) => ({
-      id: v.rule_id,
-      impact: mapSeverityToImpact(v.severity),
-      description: v.description ?? "",
-      help: v.help ?? "",
-      helpUrl: v.helpUrl ?? "",
-      nodes: (v.nodes ?? []).map((n) => ({
-        target: n.target,
-        html: n.html ?? "",
-        failureSummary: n.failureSummary ?? "",
-      })),
-      // Leave recommendation undefined; Backend-C can populate later
-      recommendation: undefined,
-    })
-  );
-
-  const passes: AccessibilityPass[] = []; // Backend-B doesn't provide passes yet
-
-  const score: number = b.score ?? 0;
-  const grade = gradeFromScore(score);
-
-  const counts: Record<Impact, number> = { critical: 0, serious: 0, moderate: 0, minor: 0 };
-  for (const v of violations) counts[v.impact]++;
-
-  const summary = {
-    total: violations.length + passes.length,
-    violations: violations.length,
-    passes: passes.length,
-    ...counts,
-  };
+/** Store a body, evicting the least recently used entry past CACHE_MAX_ENTRIES */
+function cacheResult(url: string, body: string) {
+  if (CACHE_TTL_MS <= 0) return;
+  resultCache.delete(url);
+  resultCache.set(url, { at: Date.now(), body });
+  if (resultCache.size > CACHE_MAX_ENTRIES) {
+    const oldest = resultCache.keys().next().value;
+    if (oldest !== undefined) resultCache.delete(oldest);
+  }
+}
 
-  return {
-    url: b.url,
-    score,
-    grade,
-    violations,
-    passes,
-    summary,
-    analyzedAt: b.generated_at ?? new Date().toISOString(),
-    testEngine: b.testEngine ?? "axe+lighthouse",
-  };
+/** 200 response from an already-serialized JSON body */
+function jsonBody(body: string) {
+  return new NextResponse(body, {
+    status: 200,
+    headers: { "Content-Type": "application/json" },
+  });
 }
 
 /** Proxy-first: try Backend-B; if it errors or not configured, fall back to mock. */
@@ -363,10 +350,12 @@ export async function POST(req: NextRequest) {
     return NextResponse.json({ error: msg }, { status: 400 });
   }
 
-  const B_URL = process.env.BACKEND_B_URL;
-  const force = process.env.FORCE_BACKEND_B === "1";
   const url = parsed.data.url;
-  console.log("[analyze] BACKEND_B_URL =", B_URL, "FORCE =", force);
+  console.log("[analyze] BACKEND_B_URL =", B_URL, "FORCE =", FORCE_B);
+
+  // Repeat audits of the same URL within the TTL skip Backend-B entirely
+  const cached = getCachedResult(url);
+  if (cached) return jsonBody(cached);
 
   async function callBackendB(targetUrl: string) {
     if (!B_URL) throw new Error("BACKEND_B_URL not set");
@@ -385,8 +374,6 @@ export async function POST(req: NextRequest) {
     if (!id) throw new Error("create ok but no job_id/id");
 
     // 2) poll until done / score present
-    const timeoutMs = Number(process.env.ANALYZE_TIMEOUT_MS || 30000);
-    const pollMs = Number(process.env.ANALYZE_POLL_MS || 1200);
     const start = Date.now();
 
     while (true) {
@@ -398,18 +385,20 @@ export async function POST(req: NextRequest) {
       if (pollJson?.status === "done" || pollJson?.score !== undefined) {
         return pollJson;
       }
-      if (Date.now() - start > timeoutMs) throw new Error("analyze timeout");
-      await new Promise((r) => setTimeout(r, pollMs));
+      if (Date.now() - start > TIMEOUT_MS) throw new Error("analyze timeout");
+      await new Promise((r) => setTimeout(r, POLL_MS));
     }
   }
 
   try {
     const bRaw = await callBackendB(url);
     const mapped = mapBResultToAccessibilityResults(bRaw);
-    return NextResponse.json(mapped, { status: 200 });
+    const out = JSON.stringify(mapped);
+    cacheResult(url, out);
+    return jsonBody(out);
   } catch (e: any) {
     console.warn("[analyze] Backend-B error:", e?.message);
-    if (force) {
+    if (FORCE_B) {
       // show the real reason instead of masking with a mock
       return NextResponse.json(
         { error: "backend_b_failed", detail: String(e?.message) },
@@ -1,6 +1,31 @@
 // app/api/scrape/route.ts
 import { NextRequest, NextResponse } from "next/server";
-import puppeteer from "puppeteer";
+import puppeteer, { type Browser, type Page } from "puppeteer";
+
+/** Shared headless browser, launched on first use and reused across requests */
+let browserPromise: Promise<Browser> | null = null;
+
+/** Return the shared browser, relaunching it if it has crashed or been closed */
+function getBrowser(): Promise<Browser> {
+  if (!browserPromise) {
+    browserPromise = puppeteer
+      .launch({
+        headless: true,
+        args: ["--no-sandbox", "--disable-setuid-sandbox"],
+      })
+      .then((browser) => {
+        browser.on("disconnected", () => {
+          browserPromise = null;
+        });
+        return browser;
+      })
+      .catch((err) => {
+        browserPromise = null;
+        throw err;
+      });
+  }
+  return browserPromise;
+}
 
 export async function POST(req: NextRequest) {
   const { url } = await req.json();
@@ -8,20 +33,19 @@ export async function POST(req: NextRequest) {
     return NextResponse.json({ error: "Missing URL" }, { status: 400 });
   }
 
-  let browser;
+  let page: Page | undefined;
   try {
-    browser = await puppeteer.launch({
-      headless: true,
-      args: ["--no-sandbox", "--disable-setuid-sandbox"],
-    });
-
-    const page = await browser.newPage();
+    const browser = await getBrowser();
+    page = await browser.newPage();
     await page.goto(url, { waitUntil: "networkidle2", timeout: 60000 });
 
-    const html = await page.content();
-    const title = await page.title();
-    const text = await page.evaluate(() => document.body.innerText);
-    const images = await page.$$eval("img", (imgs) => imgs.map((img) => (img as HTMLImageElement).src).filter(Boolean));
+    // Independent reads; run them concurrently rather than one round-trip at a time
+    const [html, title, text, images] = await Promise.all([
+      page.content(),
+      page.title(),
+      page.evaluate(() => document.body.innerText),
+      page.$$eval("img", (imgs) => imgs.map((img) => (img as HTMLImageElement).src).filter(Boolean)),
+    ]);
 
     const packaged = {
       url,
@@ -37,6 +61,7 @@ export async function POST(req: NextRequest) {
       { status: 500 }
     );
   } finally {
-    if (browser) await browser.close();
+    // Close off the response path; a failed close (e.g. crashed browser) must not mask the result
+    if (page) page.close().catch((err) => console.warn("Closing page failed:", err?.message));
   }
 }
@@ -25,6 +25,8 @@ interface ResultsDashboardProps {
 }
 
 export function ResultsDashboard({ results, onBack }: ResultsDashboardProps) {
+  const recommended = results.violations.filter((v) => v.recommendation)
+
   const getScoreColor = (score: number) => {
     if (score >= 90) return "text-green-500"
     if (score >= 80) return "text-yellow-500"
@@ -189,22 +191,20 @@ export function ResultsDashboard({ results, onBack }: ResultsDashboardProps) {
           )}
 
           {/* Recommendations */}
-          {results.violations.some((v) => v.recommendation) && (
+          {recommended.length > 0 && (
             <Card className="p-6">
               <div className="flex items-center gap-2 mb-6">
                 <Lightbulb className="w-5 h-5 text-yellow-500" />
                 <h2 className="text-xl font-semibold">Actionable Recommendations</h2>
                 <Badge variant="outline" className="bg-yellow-500/10 text-yellow-500 border-yellow-500/20">
-                  {results.violations.filter((v) => v.recommendation).length}
+                  {recommended.length}
                 </Badge>
               </div>
 
               <div className="space-y-4">
-                {results.violations
-                  .filter((violation) => violation.recommendation)
-                  .map((violation, index) => (
-                    <RecommendationCard key={index} recommendation={violation.recommendation!} />
-                  ))}
+                {recommended.map((violation, index) => (
+                  <RecommendationCard key={index} recommendation={violation.recommendation!} />
+                ))}
               </div>
             </Card>
           )}
@@ -10,6 +10,8 @@ import { Search, Loader2, Globe } from "lucide-react"
 import { analyzeWebsite } from "@/lib/api"
 import type { AccessibilityResults } from "@/lib/types"
 
+const EXAMPLE_URLS = ["https://github.com", "https://vercel.com", "https://stripe.com"]
+
 interface UrlInputFormProps {
   onResults?: (results: AccessibilityResults) => void
 }
@@ -103,7 +105,7 @@ export function UrlInputForm({ onResults }: UrlInputFormProps) {
         <div className="text-sm text-muted-foreground text-center">
           <p className="mb-2">Try these example websites:</p>
           <div className="flex flex-wrap justify-center gap-2">
-            {["https://github.com", "https://vercel.com", "https://stripe.com"].map((exampleUrl) => (
+            {EXAMPLE_URLS.map((exampleUrl) => (
               <button
                 key={exampleUrl}
                 onClick={() => setUrl(exampleUrl)}
@@ -1,5 +1,8 @@
 // lib/backendB.ts
-// Small typed client for Backend-B (FastAPI): create a job and poll until done.
+// Small typed client for Backend-B (FastAPI): create a job, poll until done,
+// and map its AuditResult onto the front-end AccessibilityResults shape.
+
+import type { AccessibilityResults, AccessibilityViolation, AccessibilityPass } from "./types";
 
 const B_URL = process.env.BACKEND_B_URL!;
 const TIMEOUT = Number(process.env.ANALYZE_TIMEOUT_MS || 30000);
@@ -31,3 +34,111 @@ export async function waitForAuditResult(id: string) {
     await new Promise((r) => setTimeout(r, POLL_MS));
   }
 }
+
+/** Impact union we will use for counters (keeps indexing safe) */
+type Impact = AccessibilityViolation["impact"];
+
+/** Convert numeric score to letter grade */
+export function gradeFromScore(score: number): AccessibilityResults["grade"] {
+  if (score >= 90) return "A";
+  if (score >= 80) return "B";
+  if (score >= 70) return "C";
+  if (score >= 60) return "D";
+  return "F";
+}
+
+/** Types describing Backend-B violation payloads */
+type BAuditViolation = {
+  source: "axe" | "lighthouse";
+  rule_id: string;
+  severity: Impact;
+  description?: string;
+  help?: string;
+  helpUrl?: string;
+  wcag_refs?: string[];
+  nodes?: { target: string[]; html?: string; failureSummary?: string }[];
+};
+
+/** Known Backend-B severities; anything else is treated as "moderate" */
+const SEVERITY_TO_IMPACT: Record<string, Impact> = {
+  minor: "minor",
+  moderate: "moderate",
+  serious: "serious",
+  critical: "critical",
+};
+
+/** Map Backend-B severity to our impact union via SEVERITY_TO_IMPACT */
+function mapSeverityToImpact(s: BAuditViolation["severity"] | null | undefined): Impact {
+  return s && Object.prototype.hasOwnProperty.call(SEVERITY_TO_IMPACT, s)
+    ? SEVERITY_TO_IMPACT[s]
+    : "moderate";
+}
+
+/**
+ * Normalize a node target to string[].
+ * Flat string arrays (the usual axe shape) are returned as-is without copying;
+ * nested selectors (iframe / shadow DOM targets) are flattened in order.
+ */
+function toStrList(target: unknown): string[] {
+  if (target == null) return [];
+  if (typeof target === "string") return [target];
+  if (Array.isArray(target) && target.every((t) => typeof t === "string")) {
+    return target as string[];
+  }
+  const out: string[] = [];
+  const walk = (x: unknown) => {
+    if (typeof x === "string") out.push(x);
+    else if (Array.isArray(x)) x.forEach(walk);
+    else if (x != null) out.push(String(x));
+  };
+  walk(target);
+  return out;
+}
+
+/** Convert Backend-B AuditResult into the front-end AccessibilityResults */
+export function mapBResultToAccessibilityResults(b: any): AccessibilityResults {
+  // Single pass: build each violation and tally its impact in the same loop
+  const counts: Record<Impact, number> = { critical: 0, serious: 0, moderate: 0, minor: 0 };
+  const violations: AccessibilityViolation[] = [];
+  for (const v of (b.violations ?? []) as BAuditViolation[]) {
+    const impact = mapSeverityToImpact(v.severity);
+    counts[impact]++;
+    violations.push({
+      id: v.rule_id,
+      impact,
+      description: v.description ?? "",
+      help: v.help ?? "",
+      helpUrl: v.helpUrl ?? "",
+      nodes: (v.nodes ?? []).map((n) => ({
+        target: toStrList(n.target),
+        html: n.html ?? "",
+        failureSummary: n.failureSummary ?? "",
+      })),
+      // Leave recommendation undefined; Backend-C can populate later
+      recommendation: undefined,
+    });
+  }
+
+  const passes: AccessibilityPass[] = []; // Backend-B doesn't provide passes yet
+
+  const score: number = b.score ?? 0;
+  const grade = gradeFromScore(score);
+
+  const summary = {
+    total: violations.length + passes.length,
+    violations: violations.length,
+    passes: passes.length,
+    ...counts,
+  };
+
+  return {
+    url: b.url,
+    score,
+    grade,
+    violations,
+    passes,
+    summary,
+    analyzedAt: b.generated_at ?? new Date().toISOString(),
+    testEngine: b.testEngine ?? "axe+lighthouse",
+  };
+}